@@ -57,31 +57,34 @@ function ticksInYear() {
     return 8760/hours_in_tick;
 }
 
+const tick_names = {
+    1: "Hour",
+    24: "Day",
+    168: "Week"
+};
+
 function tickName () {
-    const mapping = {
-        1: "Hour",
-        24: "Day",
-        168: "Week"
-    }
-    return mapping[hours_in_tick];
-}
+    return tick_names[hours_in_tick];
+}
+
+// sentiment penalty for each ad level
+const ad_level_mapping = {
+    0: 0,
+    10: -1,
+    20: -2,
+    30: -3,
+    40: -5,
+    50: -7,
+    60: -9,
+    70: -11,
+    80: -13,
+    90: -15,
+    100: -20
+};
 
 function calculateSentiment () {
     // 0 - 100 scale
     let base = 100;
-    let ad_level_mapping = {
-        0: 0,
-        10: -1,
-        20: -2,
-        30: -3,
-        40: -5,
-        50: -7,
-        60: -9,
-        70: -11,
-        80: -13,
-        90: -15,
-        100: -20
-    }
     let ad_adjusted = base + ad_level_mapping[ad_level];
     // lazy approach here, scaling the 0-100 to a 0-20 by dividing by 5. figure that the moderation level is already on a reciprocal scale so w/e
     let mod_adjusted = ad_adjusted - Math.round(calculateModerationLevel()/5);
@@ -104,10 +107,11 @@ function getAdRevenueInTimestep () {
     return revenue;
 }
 
+// Assume $50/y as reasonable per-user rev and a 1-y payback period on CAC, so it should cost about $50 to acquire a user
+// and p(churn) is base at 0.5/y = 2y life expectancy, so this gives the user good economics => basically double their money invested after 2y
+const probabilityPerDollar = 1.0/50;
+
 function marketingGrowthInTimestep () {
-    // Assume $50/y as reasonable per-user rev and a 1-y payback period on CAC, so it should cost about $50 to acquire a user
-    // and p(churn) is base at 0.5/y = 2y life expectancy, so this gives the user good economics => basically double their money invested after 2y
-    const probabilityPerDollar = 1.0/50;
     // basically binomial probability where every dollar of marketing spend is another trial
     const trials = Math.round(marketing_spend * hours_in_tick);
     if (trials === 0) {
@@ -115,7 +119,11 @@ function marketingGrowthInTimestep () {
         return [0, 0];
     }
     // return users actually added in timestep, and expected value
-    return [binomial(Math.round(marketing_spend * hours_in_tick), probabilityPerDollar), Math.round(marketing_spend * hours_in_tick) * probabilityPerDollar]
+    return [binomial(Math.round(marketing_spend * hours_in_tick), probabilityPerDollar), expectedMarketingGrowthInTimestep()]
+}
+
+function expectedMarketingGrowthInTimestep () {
+    return Math.round(marketing_spend * hours_in_tick) * probabilityPerDollar;
 }
 
 function marketingSpendInTimestep () {
@@ -151,7 +159,11 @@ function calculateChurnProbability () {
 
 function churn () {
     // return actual sample, expected value
-    return [binomial(Math.round(users), calculateChurnProbability()), Math.round(users) * calculateChurnProbability()];
+    return [binomial(Math.round(users), calculateChurnProbability()), expectedChurn()];
+}
+
+function expectedChurn () {
+    return Math.round(users) * calculateChurnProbability();
 }
 
 function calculateModerationLevel () {
@@ -232,10 +244,11 @@ function paintInterface () {
     `;
 
     // debug section
-    document.getElementById("ev_organic_growth").innerHTML = organicGrowth()[1];
-    document.getElementById("ev_churn").innerHTML = churn()[1];
+    // only the expected values are shown, so don't draw binomial samples on every repaint
+    document.getElementById("ev_organic_growth").innerHTML = expectedOrganicGrowth();
+    document.getElementById("ev_churn").innerHTML = expectedChurn();
     document.getElementById("ev_revenue").innerHTML = getAdRevenueInTimestep();
-    document.getElementById("ev_marketing_growth").innerHTML = marketingGrowthInTimestep()[1];
+    document.getElementById("ev_marketing_growth").innerHTML = expectedMarketingGrowthInTimestep();
     // downtime
 
     // TODO: move the gameoutputcontainer stuff from the timestep function to here
@@ -281,7 +294,11 @@ function calculateOrganicGrowthProbability () {
 
 function organicGrowth () {
     // return actual value, and expected value
-    return [binomial(Math.round(users), calculateOrganicGrowthProbability()), Math.round(users) * calculateOrganicGrowthProbability()];
+    return [binomial(Math.round(users), calculateOrganicGrowthProbability()), expectedOrganicGrowth()];
+}
+
+function expectedOrganicGrowth () {
+    return Math.round(users) * calculateOrganicGrowthProbability();
 }
 
 // USER ACTIONS